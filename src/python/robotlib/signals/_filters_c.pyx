@@ -0,0 +1,95 @@
+# cython: language_level=3
+"""
+Compiled single-step versions of the band filters in
+``robotlib.signals.filters``.
+
+Only the band filters use this, since they update two filters per step. For
+``LowPassFilter`` and ``HighPassFilter``, converting their state to and from
+Python floats on every call costs as much as the pure-Python step.
+
+This module is optional. If it has not been built, the filters fall back to
+their pure-Python implementations. To build it in place, run::
+
+    cythonize -i src/python/robotlib/signals/_filters_c.pyx
+"""
+
+cimport cython
+
+from libc.math cimport M_PI
+
+cdef double _TWO_PI = 2.0 * M_PI
+
+
+ctypedef struct FilterState:
+    double prev_output
+    double prev_value
+
+
+@cython.cdivision(True)
+cdef inline double _lpf(double value, double alpha, FilterState* state):
+    state.prev_output = alpha * value + (1.0 - alpha) * state.prev_output
+    return state.prev_output
+
+
+@cython.cdivision(True)
+cdef inline double _hpf(double value, double alpha, FilterState* state):
+    state.prev_output = alpha * (state.prev_output + value - state.prev_value)
+    state.prev_value = value
+    return state.prev_output
+
+
+@cython.cdivision(True)
+cdef inline double _lpf_alpha(double dt, double cutoff_freq):
+    cdef double a = _TWO_PI * dt * cutoff_freq
+    return a / (a + 1.0)
+
+
+@cython.cdivision(True)
+cdef inline double _hpf_alpha(double dt, double cutoff_freq):
+    return 1.0 / (_TWO_PI * dt * cutoff_freq + 1.0)
+
+
+cpdef tuple band_pass_step(
+        double value,
+        double dt,
+        double low_cutoff_freq,
+        double high_cutoff_freq,
+        double hp_prev_output,
+        double hp_prev_value,
+        double lp_prev_output
+):
+    """Returns the next ``(hp_output, output)`` of a band-pass filter."""
+
+    cdef FilterState hp_state, lp_state
+    hp_state.prev_output = hp_prev_output
+    hp_state.prev_value = hp_prev_value
+    lp_state.prev_output = lp_prev_output
+
+    cdef double hp_output = _hpf(
+        value, _hpf_alpha(dt, low_cutoff_freq), &hp_state)
+    cdef double output = _lpf(
+        hp_output, _lpf_alpha(dt, high_cutoff_freq), &lp_state)
+    return hp_output, output
+
+
+cpdef tuple band_stop_step(
+        double value,
+        double dt,
+        double low_cutoff_freq,
+        double high_cutoff_freq,
+        double lp_prev_output,
+        double hp_prev_output,
+        double hp_prev_value
+):
+    """Returns the next ``(lp_output, hp_output)`` of a band-stop filter."""
+
+    cdef FilterState lp_state, hp_state
+    lp_state.prev_output = lp_prev_output
+    hp_state.prev_output = hp_prev_output
+    hp_state.prev_value = hp_prev_value
+
+    cdef double lp_output = _lpf(
+        value, _lpf_alpha(dt, low_cutoff_freq), &lp_state)
+    cdef double hp_output = _hpf(
+        value, _hpf_alpha(dt, high_cutoff_freq), &hp_state)
+    return lp_output, hp_output
@@ -0,0 +1,281 @@
+from math import pi
+from typing import Tuple, Union
+
+import numpy as np
+
+_TWO_PI = 2.0 * pi
+
+ArrayLike = Union[float, np.ndarray]
+
+
+class FilterBank:
+    """
+    A bank of independent filters, one per channel, which are all updated
+    together with a single call. This is much faster than keeping a separate
+    filter object for every channel.
+    """
+
+    __slots__ = ()
+
+    def __call__(self, values: np.ndarray, dt: float) -> np.ndarray:
+        return self.filter(values, dt)
+
+    def filter(self, values: np.ndarray, dt: float) -> np.ndarray:
+        """
+        :param values: Array with one value per channel.
+        :param dt: Time step, shared by all channels.
+        :return: Array with one output per channel.
+        """
+
+        raise NotImplementedError()
+
+
+def _to_channel_array(
+        values: ArrayLike,
+        shape: tuple,
+        name: str
+) -> np.ndarray:
+    try:
+        return np.array(np.broadcast_to(values, shape), dtype=float)
+    except ValueError:
+        raise ValueError(
+            f'{name} must be a scalar or have shape {shape}; '
+            f'got shape {np.shape(values)}.'
+        )
+
+
+class _SingleCutoffFreqFilterBank(FilterBank):
+    __slots__ = (
+        '_cutoff_freqs',
+        '_prev_outputs',
+        '_cached_dt',
+        '_cached_alphas',
+    )
+
+    def __init__(self, cutoff_freqs: np.ndarray, init_values: ArrayLike = 0.0):
+        """
+        :param cutoff_freqs: 1D array of cutoff frequencies, one per channel.
+        :param init_values: Initial value of every channel, or an array of
+            initial values, one per channel.
+        """
+
+        cutoff_freqs = np.array(cutoff_freqs, dtype=float)
+        if cutoff_freqs.ndim != 1:
+            raise ValueError(
+                f'cutoff_freqs must be 1D; got shape {cutoff_freqs.shape}.')
+
+        self._cutoff_freqs = np.zeros_like(cutoff_freqs)
+        self._cached_dt = None
+        self._cached_alphas = None
+        self.set_cutoff_freqs(cutoff_freqs)
+
+        self._prev_outputs = _to_channel_array(
+            init_values, cutoff_freqs.shape, 'init_values')
+
+    def get_channel_count(self) -> int:
+        return self._cutoff_freqs.size
+
+    def get_cutoff_freqs(self) -> np.ndarray:
+        return self._cutoff_freqs.copy()
+
+    def set_cutoff_freqs(self, cutoff_freqs: ArrayLike) -> None:
+        cutoff_freqs = _to_channel_array(
+            cutoff_freqs, self._cutoff_freqs.shape, 'cutoff_freqs')
+        self._check_cutoff_freqs(cutoff_freqs)
+        self._cutoff_freqs = cutoff_freqs
+
+        # Invalidate the cached alphas
+        self._cached_dt = None
+
+    def _check_cutoff_freqs(self, cutoff_freqs: np.ndarray) -> None:
+        if np.any(cutoff_freqs < 0):
+            raise ValueError(
+                f'cutoff_freqs must all be >= 0; got {cutoff_freqs}.')
+
+    def _get_alphas(self, dt: float) -> np.ndarray:
+        if dt != self._cached_dt:
+            self._cached_alphas = self._calc_alphas(dt)
+            self._cached_dt = dt
+
+        return self._cached_alphas
+
+    def _calc_alphas(self, dt: float) -> np.ndarray:
+        raise NotImplementedError()
+
+
+class LowPassFilterBank(_SingleCutoffFreqFilterBank):
+    """
+    A bank of :class:`robotlib.signals.filters.LowPassFilter`, one per
+    channel.
+    """
+
+    __slots__ = ('_scratch',)
+
+    def __init__(self, cutoff_freqs: np.ndarray, init_values: ArrayLike = 0.0):
+        super().__init__(cutoff_freqs, init_values)
+        self._scratch = np.empty_like(self._prev_outputs)
+
+    def filter(self, values: np.ndarray, dt: float) -> np.ndarray:
+        alphas = self._get_alphas(dt)
+        prev_outputs = self._prev_outputs
+        scratch = self._scratch
+
+        # prev_outputs = alpha * values + (1 - alpha) * prev_outputs
+        np.subtract(values, prev_outputs, out=scratch)
+        scratch *= alphas
+        prev_outputs += scratch
+
+        return prev_outputs.copy()
+
+    def _calc_alphas(self, dt: float) -> np.ndarray:
+        a = _TWO_PI * dt * self._cutoff_freqs
+        return a / (a + 1.0)
+
+
+class HighPassFilterBank(_SingleCutoffFreqFilterBank):
+    """
+    A bank of :class:`robotlib.signals.filters.HighPassFilter`, one per
+    channel.
+    """
+
+    __slots__ = ('_prev_values',)
+
+    def __init__(self, cutoff_freqs: np.ndarray, init_values: ArrayLike = 0.0):
+        super().__init__(cutoff_freqs, init_values)
+        self._prev_values = self._prev_outputs.copy()
+
+    def filter(self, values: np.ndarray, dt: float) -> np.ndarray:
+        alphas = self._get_alphas(dt)
+        prev_outputs = self._prev_outputs
+        prev_values = self._prev_values
+
+        # prev_outputs = alpha * (prev_outputs + values - prev_values)
+        prev_outputs += values
+        prev_outputs -= prev_values
+        prev_outputs *= alphas
+        prev_values[:] = values
+
+        return prev_outputs.copy()
+
+    def _calc_alphas(self, dt: float) -> np.ndarray:
+        return 1.0 / (_TWO_PI * dt * self._cutoff_freqs + 1.0)
+
+
+class BandPassFilterBank(FilterBank):
+    """
+    A bank of :class:`robotlib.signals.filters.BandPassFilter`, one per
+    channel.
+    """
+
+    __slots__ = (
+        '_low_cutoff_freqs',
+        '_high_cutoff_freqs',
+        '_hp_prev_outputs',
+        '_hp_prev_values',
+        '_lp_prev_outputs',
+        '_cached_dt',
+        '_cached_hp_alphas',
+        '_cached_lp_alphas',
+        '_scratch',
+    )
+
+    def __init__(
+            self,
+            low_cutoff_freqs: np.ndarray,
+            high_cutoff_freqs: np.ndarray,
+            init_values: ArrayLike = 0.0
+    ):
+        """
+        :param low_cutoff_freqs: 1D array of low cutoff frequencies, one per
+            channel.
+        :param high_cutoff_freqs: 1D array of high cutoff frequencies, one per
+            channel.
+        :param init_values: Initial value of every channel, or an array of
+            initial values, one per channel.
+        """
+
+        low_cutoff_freqs = np.array(low_cutoff_freqs, dtype=float)
+        if low_cutoff_freqs.ndim != 1:
+            raise ValueError(
+                f'low_cutoff_freqs must be 1D; '
+                f'got shape {low_cutoff_freqs.shape}.'
+            )
+
+        self._low_cutoff_freqs = low_cutoff_freqs
+        self._high_cutoff_freqs = None
+        self._cached_dt = None
+        self._cached_hp_alphas = None
+        self._cached_lp_alphas = None
+        self.set_cutoff_freqs(low_cutoff_freqs, high_cutoff_freqs)
+
+        shape = low_cutoff_freqs.shape
+        self._hp_prev_outputs = _to_channel_array(
+            init_values, shape, 'init_values')
+        self._hp_prev_values = self._hp_prev_outputs.copy()
+        self._lp_prev_outputs = self._hp_prev_outputs.copy()
+        self._scratch = np.empty_like(self._hp_prev_outputs)
+
+    def get_channel_count(self) -> int:
+        return self._low_cutoff_freqs.size
+
+    def get_cutoff_freqs(self) -> Tuple[np.ndarray, np.ndarray]:
+        return self._low_cutoff_freqs.copy(), self._high_cutoff_freqs.copy()
+
+    def set_cutoff_freqs(
+            self,
+            low_cutoff_freqs: ArrayLike,
+            high_cutoff_freqs: ArrayLike
+    ) -> None:
+        shape = self._low_cutoff_freqs.shape
+        low_cutoff_freqs = _to_channel_array(
+            low_cutoff_freqs, shape, 'low_cutoff_freqs')
+        high_cutoff_freqs = _to_channel_array(
+            high_cutoff_freqs, shape, 'high_cutoff_freqs')
+
+        self._check_cutoff_freqs(low_cutoff_freqs, high_cutoff_freqs)
+
+        self._low_cutoff_freqs = low_cutoff_freqs
+        self._high_cutoff_freqs = high_cutoff_freqs
+
+        # Invalidate the cached alphas
+        self._cached_dt = None
+
+    def _check_cutoff_freqs(
+            self,
+            low_cutoff_freqs: np.ndarray,
+            high_cutoff_freqs: np.ndarray
+    ) -> None:
+        if np.any(low_cutoff_freqs < 0):
+            raise ValueError(
+                f'low_cutoff_freqs must all be >= 0; got {low_cutoff_freqs}.')
+
+        if np.any(low_cutoff_freqs > high_cutoff_freqs):
+            raise ValueError(
+                f'low_cutoff_freqs ({low_cutoff_freqs}) cannot be higher than '
+                f'high_cutoff_freqs ({high_cutoff_freqs}).'
+            )
+
+    def filter(self, values: np.ndarray, dt: float) -> np.ndarray:
+        if dt != self._cached_dt:
+            self._cached_hp_alphas = 1.0 / (
+                    _TWO_PI * dt * self._low_cutoff_freqs + 1.0)
+            a = _TWO_PI * dt * self._high_cutoff_freqs
+            self._cached_lp_alphas = a / (a + 1.0)
+            self._cached_dt = dt
+
+        hp_alphas = self._cached_hp_alphas
+        lp_alphas = self._cached_lp_alphas
+        scratch = self._scratch
+
+        hp_outputs = self._hp_prev_outputs
+        hp_outputs += values
+        hp_outputs -= self._hp_prev_values
+        hp_outputs *= hp_alphas
+        self._hp_prev_values[:] = values
+
+        lp_outputs = self._lp_prev_outputs
+        np.subtract(hp_outputs, lp_outputs, out=scratch)
+        scratch *= lp_alphas
+        lp_outputs += scratch
+
+        return lp_outputs.copy()
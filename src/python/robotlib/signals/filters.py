@@ -1,7 +1,43 @@
 from math import pi
+from typing import Tuple, Union
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """Stand-in for ``numba.njit`` when numba is not installed."""
+
+        def decorator(func):
+            return func
+
+        return decorator
+
+try:
+    from scipy.signal import lfilter
+except ImportError:
+    lfilter = None
+
+try:
+    from robotlib.signals import _filters_c
+except ImportError:
+    # The compiled extension has not been built; use pure Python
+    _filters_c = None
+
+_TWO_PI = 2.0 * pi
 
 
 class Filter:
+    __slots__ = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        # Call filter() directly, skipping the extra stack frame of __call__
+        if 'filter' in cls.__dict__:
+            cls.__call__ = cls.filter
+
     def __call__(self, value: float, dt: float) -> float:
         return self.filter(value, dt)
 
@@ -10,8 +46,17 @@ class Filter:
 
 
 class _SingleCutoffFreqFilter(Filter):
+    __slots__ = (
+        '_cutoff_freq',
+        '_prev_output',
+        '_cached_dt',
+        '_cached_alpha',
+    )
+
     def __init__(self, cutoff_freq: float, init_value: float = 0.0):
         self._cutoff_freq = None
+        self._cached_dt = None
+        self._cached_alpha = 0.0
         self.set_cutoff_freq(cutoff_freq)
 
         self._prev_output = init_value
@@ -23,16 +68,63 @@ class _SingleCutoffFreqFilter(Filter):
         self._check_cutoff_freq(cutoff_freq)
         self._cutoff_freq = cutoff_freq
 
+        # Invalidate the cached alpha
+        self._cached_dt = None
+
     def _check_cutoff_freq(self, cutoff_freq: float) -> None:
         if cutoff_freq < 0:
             raise ValueError(f'cutoff_freq must be >= 0; got {cutoff_freq}.')
 
-    def filter(self, value: float, dt: float) -> float:
-        output = self._filter(value, dt)
-        self._prev_output = output
-        return output
+    def _get_alpha(self, dt: float) -> float:
+        if dt == self._cached_dt:
+            return self._cached_alpha
+
+        return self._update_alpha(dt)
+
+    def _update_alpha(self, dt: float) -> float:
+        """Computes alpha for the given dt, and caches it."""
+        raise NotImplementedError()
+
+    def filter_array(
+            self,
+            values: np.ndarray,
+            dt: Union[float, np.ndarray]
+    ) -> np.ndarray:
+        """
+        Filters an entire array of values at once. This is equivalent to
+        calling ``filter`` on each value in turn.
+
+        This is only faster than calling ``filter`` in a loop if ``scipy`` is
+        installed (used when ``dt`` is a scalar) or ``numba`` is installed
+        (used when ``dt`` is an array, or when ``scipy`` is missing).
+
+        :param values: 1D array of values to filter.
+        :param dt: Either a single time step used for every value, or an array
+            of time steps, one per value.
+        """
+
+        values = np.asarray(values, dtype=float)
+        if values.size == 0:
+            return values.copy()
+
+        if np.ndim(dt) == 0:
+            return self._filter_array_const_dt(values, dt)
 
-    def _filter(self, value: float, dt: float) -> float:
+        dt = np.broadcast_to(np.asarray(dt, dtype=float), values.shape)
+        return self._filter_array_var_dt(values, dt)
+
+    def _filter_array_const_dt(
+            self,
+            values: np.ndarray,
+            dt: float
+    ) -> np.ndarray:
+        raise NotImplementedError()
+
+    def _filter_array_var_dt(
+            self,
+            values: np.ndarray,
+            dt: np.ndarray
+    ) -> np.ndarray:
         raise NotImplementedError()
 
 
@@ -60,14 +152,60 @@ class LowPassFilter(_SingleCutoffFreqFilter):
     https://en.wikipedia.org/wiki/Low-pass_filter
     """
 
-    def _filter(self, value: float, dt: float) -> float:
+    __slots__ = ()
+
+    def filter(self, value: float, dt: float) -> float:
+        try:
+            if dt == self._cached_dt:
+                alpha = self._cached_alpha
+            else:
+                alpha = self._update_alpha(dt)
+        except ValueError:
+            # dt is an array, so the comparison is ambiguous
+            alpha = self._update_alpha(dt)
+
+        output = alpha * value + (1 - alpha) * self._prev_output
+
+        self._prev_output = output
+        return output
+
+    def _update_alpha(self, dt: float, _TWO_PI: float = _TWO_PI) -> float:
+        a = _TWO_PI * dt * self._cutoff_freq
+        alpha = a / (a + 1.0)
+
+        self._cached_dt = dt
+        self._cached_alpha = alpha
+        return alpha
+
+    def _filter_array_const_dt(
+            self,
+            values: np.ndarray,
+            dt: float
+    ) -> np.ndarray:
+        if lfilter is None:
+            return self._filter_array_var_dt(values, np.full_like(values, dt))
+
         alpha = self._get_alpha(dt)
-        return alpha * value + (1 - alpha) * self._prev_output
+        zi = [(1 - alpha) * self._prev_output]
+        output, _ = lfilter([alpha], [1.0, alpha - 1.0], values, zi=zi)
 
-    def _get_alpha(self, dt: float) -> float:
-        cutoff_freq = self.get_cutoff_freq()
-        a = 2 * pi * dt * cutoff_freq
-        return a / (a + 1)
+        self._prev_output = float(output[-1])
+        return output
+
+    def _filter_array_var_dt(
+            self,
+            values: np.ndarray,
+            dt: np.ndarray
+    ) -> np.ndarray:
+        output, prev_output = _lpf_run(
+            values,
+            dt,
+            float(self.get_cutoff_freq()),
+            float(self._prev_output)
+        )
+
+        self._prev_output = float(prev_output)
+        return output
 
 
 class HighPassFilter(_SingleCutoffFreqFilter):
@@ -92,47 +230,148 @@ class HighPassFilter(_SingleCutoffFreqFilter):
     https://en.wikipedia.org/wiki/High-pass_filter
     """
 
+    __slots__ = ('_prev_value',)
+
     def __init__(self, cutoff_freq: float, init_value: float = 0.0):
         super().__init__(cutoff_freq, init_value)
         self._prev_value = init_value
 
-    def _filter(self, value: float, dt: float) -> float:
-        d_value = value - self._prev_value
+    def filter(self, value: float, dt: float) -> float:
+        try:
+            if dt == self._cached_dt:
+                alpha = self._cached_alpha
+            else:
+                alpha = self._update_alpha(dt)
+        except ValueError:
+            # dt is an array, so the comparison is ambiguous
+            alpha = self._update_alpha(dt)
+
+        output = alpha * (self._prev_output + value - self._prev_value)
+
         self._prev_value = value
+        self._prev_output = output
+        return output
+
+    def _update_alpha(self, dt: float, _TWO_PI: float = _TWO_PI) -> float:
+        alpha = 1.0 / (_TWO_PI * dt * self._cutoff_freq + 1.0)
+
+        self._cached_dt = dt
+        self._cached_alpha = alpha
+        return alpha
+
+    def _filter_array_const_dt(
+            self,
+            values: np.ndarray,
+            dt: float
+    ) -> np.ndarray:
+        if lfilter is None:
+            return self._filter_array_var_dt(values, np.full_like(values, dt))
 
         alpha = self._get_alpha(dt)
-        return alpha * (self._prev_output + d_value)
+        zi = [alpha * (self._prev_output - self._prev_value)]
+        output, _ = lfilter([alpha, -alpha], [1.0, -alpha], values, zi=zi)
 
-    def _get_alpha(self, dt: float) -> float:
-        cutoff_freq = self.get_cutoff_freq()
-        return 1 / (2 * pi * dt * cutoff_freq + 1)
+        self._prev_output = float(output[-1])
+        self._prev_value = float(values[-1])
+        return output
+
+    def _filter_array_var_dt(
+            self,
+            values: np.ndarray,
+            dt: np.ndarray
+    ) -> np.ndarray:
+        output, prev_output, prev_value = _hpf_run(
+            values,
+            dt,
+            float(self.get_cutoff_freq()),
+            float(self._prev_output),
+            float(self._prev_value)
+        )
+
+        self._prev_output = float(prev_output)
+        self._prev_value = float(prev_value)
+        return output
+
+
+@njit(cache=True, fastmath=True)
+def _lpf_run(
+        values: np.ndarray,
+        dt: np.ndarray,
+        cutoff_freq: float,
+        prev_output: float
+) -> Tuple[np.ndarray, float]:
+    """Low-pass filter recurrence over arrays of values and time steps."""
+
+    output = np.empty_like(values)
+
+    for i in range(values.size):
+        a = _TWO_PI * dt[i] * cutoff_freq
+        alpha = a / (a + 1)
+        prev_output = alpha * values[i] + (1 - alpha) * prev_output
+        output[i] = prev_output
+
+    return output, prev_output
+
+
+@njit(cache=True, fastmath=True)
+def _hpf_run(
+        values: np.ndarray,
+        dt: np.ndarray,
+        cutoff_freq: float,
+        prev_output: float,
+        prev_value: float
+) -> Tuple[np.ndarray, float, float]:
+    """High-pass filter recurrence over arrays of values and time steps."""
+
+    output = np.empty_like(values)
+
+    for i in range(values.size):
+        alpha = 1 / (_TWO_PI * dt[i] * cutoff_freq + 1)
+        prev_output = alpha * (prev_output + values[i] - prev_value)
+        prev_value = values[i]
+        output[i] = prev_output
+
+    return output, prev_output, prev_value
 
 
 class _LowHighCutoffFreqsFilter(Filter):
+    __slots__ = ('_low_cutoff_freq', '_high_cutoff_freq')
+
     def __init__(
             self,
             low_cutoff_freq: float,
             high_cutoff_freq: float
     ):
-        self._check_cutoff_freqs(low_cutoff_freq, high_cutoff_freq)
+        self._low_cutoff_freq = None
+        self._high_cutoff_freq = None
+        self.set_cutoff_freqs(low_cutoff_freq, high_cutoff_freq)
 
     def _check_cutoff_freqs(
             self,
             low_cutoff_freq: float,
             high_cutoff_freq: float
     ) -> None:
+        if low_cutoff_freq < 0:
+            raise ValueError(
+                f'low_cutoff_freq must be >= 0; got {low_cutoff_freq}.')
+
         if low_cutoff_freq > high_cutoff_freq:
             raise ValueError(
                 f'low_cutoff_freq ({low_cutoff_freq}) cannot be higher than '
                 f'high_cutoff_freq ({high_cutoff_freq}).'
             )
 
+    def get_cutoff_freqs(self) -> Tuple[float, float]:
+        return self._low_cutoff_freq, self._high_cutoff_freq
+
     def set_cutoff_freqs(
             self,
             low_cutoff_freq: float,
             high_cutoff_freq: float
     ) -> None:
         self._check_cutoff_freqs(low_cutoff_freq, high_cutoff_freq)
+        self._low_cutoff_freq = low_cutoff_freq
+        self._high_cutoff_freq = high_cutoff_freq
 
 
 class BandPassFilter(_LowHighCutoffFreqsFilter):
@@ -150,9 +389,14 @@ class BandPassFilter(_LowHighCutoffFreqsFilter):
         0|__________/__._______.__\\________ freq
         low_cutoff_freq^       ^high_cutoff_freq
 
+    This is a high-pass filter at ``low_cutoff_freq`` followed by a low-pass
+    filter at ``high_cutoff_freq``, computed in a single step.
+
     https://en.wikipedia.org/wiki/Band-pass_filter
     """
 
+    __slots__ = ('_hp_prev_output', '_hp_prev_value', '_lp_prev_output')
+
     def __init__(
             self,
             low_cutoff_freq: float,
@@ -161,23 +405,38 @@ class BandPassFilter(_LowHighCutoffFreqsFilter):
     ):
         super().__init__(low_cutoff_freq, high_cutoff_freq)
 
-        self._hpf = HighPassFilter(low_cutoff_freq, init_value=init_value)
-        self._lpf = LowPassFilter(high_cutoff_freq, init_value=init_value)
-
-    def set_cutoff_freqs(
-            self,
-            low_cutoff_freq: float,
-            high_cutoff_freq: float
-    ) -> None:
-        super().set_cutoff_freqs(low_cutoff_freq, high_cutoff_freq)
-
-        self._hpf.set_cutoff_freq(low_cutoff_freq)
-        self._lpf.set_cutoff_freq(high_cutoff_freq)
+        self._hp_prev_output = init_value
+        self._hp_prev_value = init_value
+        self._lp_prev_output = init_value
 
     def filter(self, value: float, dt: float) -> float:
-        value = self._hpf(value, dt)
-        value = self._lpf(value, dt)
-        return value
+        if _filters_c is not None:
+            hp_output, output = _filters_c.band_pass_step(
+                value,
+                dt,
+                self._low_cutoff_freq,
+                self._high_cutoff_freq,
+                self._hp_prev_output,
+                self._hp_prev_value,
+                self._lp_prev_output
+            )
+            self._hp_prev_value = value
+            self._hp_prev_output = hp_output
+            self._lp_prev_output = output
+            return output
+
+        hp_alpha = 1 / (_TWO_PI * dt * self._low_cutoff_freq + 1)
+        a = _TWO_PI * dt * self._high_cutoff_freq
+        lp_alpha = a / (a + 1)
+
+        hp_output = hp_alpha * (
+                self._hp_prev_output + value - self._hp_prev_value)
+        self._hp_prev_value = value
+        self._hp_prev_output = hp_output
+
+        output = lp_alpha * hp_output + (1 - lp_alpha) * self._lp_prev_output
+        self._lp_prev_output = output
+        return output
 
 
 class BandStopFilter(_LowHighCutoffFreqsFilter):
@@ -195,9 +454,14 @@ class BandStopFilter(_LowHighCutoffFreqsFilter):
         0|_____________.__\\_______/__.___________ freq
         low_cutoff_freq^             ^high_cutoff_freq
 
+    This is the sum of a low-pass filter at ``low_cutoff_freq`` and a
+    high-pass filter at ``high_cutoff_freq``, computed in a single step.
+
     https://en.wikipedia.org/wiki/Band-stop_filter
     """
 
+    __slots__ = ('_lp_prev_output', '_hp_prev_output', '_hp_prev_value')
+
     def __init__(
             self,
             low_cutoff_freq: float,
@@ -206,18 +470,36 @@ class BandStopFilter(_LowHighCutoffFreqsFilter):
     ):
         super().__init__(low_cutoff_freq, high_cutoff_freq)
 
-        self._lpf = LowPassFilter(low_cutoff_freq, init_value=init_value)
-        self._hpf = HighPassFilter(high_cutoff_freq, init_value=init_value)
+        self._lp_prev_output = init_value
+        self._hp_prev_output = init_value
+        self._hp_prev_value = init_value
 
-    def set_cutoff_freqs(
-            self,
-            low_cutoff_freq: float,
-            high_cutoff_freq: float
-    ) -> None:
-        super().set_cutoff_freqs(low_cutoff_freq, high_cutoff_freq)
+    def filter(self, value: float, dt: float) -> float:
+        if _filters_c is not None:
+            lp_output, hp_output = _filters_c.band_stop_step(
+                value,
+                dt,
+                self._low_cutoff_freq,
+                self._high_cutoff_freq,
+                self._lp_prev_output,
+                self._hp_prev_output,
+                self._hp_prev_value
+            )
+            self._lp_prev_output = lp_output
+            self._hp_prev_value = value
+            self._hp_prev_output = hp_output
+            return lp_output + hp_output
 
-        self._lpf.set_cutoff_freq(low_cutoff_freq)
-        self._hpf.set_cutoff_freq(high_cutoff_freq)
+        a = _TWO_PI * dt * self._low_cutoff_freq
+        lp_alpha = a / (a + 1)
+        hp_alpha = 1 / (_TWO_PI * dt * self._high_cutoff_freq + 1)
 
-    def filter(self, value: float, dt: float) -> float:
-        return self._lpf(value, dt) + self._hpf(value, dt)
+        lp_output = lp_alpha * value + (1 - lp_alpha) * self._lp_prev_output
+        self._lp_prev_output = lp_output
+
+        hp_output = hp_alpha * (
+                self._hp_prev_output + value - self._hp_prev_value)
+        self._hp_prev_value = value
+        self._hp_prev_output = hp_output
+
+        return lp_output + hp_output
@@ -4,10 +4,16 @@ from abc import ABC
 from math import pi
 from typing import Iterator, List
 
-from robotlib.clocks import Clock, get_rtc
+import numpy as np
+
+from robotlib.clocks import Clock, SimClock, get_rtc
+
+_TWO_PI = 2.0 * pi
 
 
 class SignalGenerator(Iterator[float], ABC):
+    __slots__ = ()
+
     def __iter__(self) -> Iterator[float]:
         return self
 
@@ -23,8 +29,41 @@ class SignalGenerator(Iterator[float], ABC):
         for _ in range(sample_count):
             yield self.sample()
 
+    def sample_array(self, dt: float, n: int) -> np.ndarray:
+        """
+        Returns ``n`` samples spaced ``dt`` seconds apart, as an array.
+
+        Subclasses should override this with a vectorized implementation. By
+        default, this just collects ``n`` calls to ``sample`` and ignores
+        ``dt``.
+        """
+
+        return np.fromiter(self.sample_count(n), dtype=float, count=n)
+
+    def sample_batches(
+            self,
+            dt: float,
+            total: int,
+            chunk: int = 1024
+    ) -> Iterator[np.ndarray]:
+        """
+        Yields ``total`` samples spaced ``dt`` seconds apart, in arrays of up
+        to ``chunk`` samples each.
+        """
+
+        self._check_chunk(chunk)
+
+        for start in range(0, total, chunk):
+            yield self.sample_array(dt, min(chunk, total - start))
+
+    def _check_chunk(self, chunk: int) -> None:
+        if chunk <= 0:
+            raise ValueError(f'chunk must be > 0; got {chunk}.')
+
 
 class TimeDependentSignalGenerator(SignalGenerator, ABC):
+    __slots__ = ('_clock',)
+
     def __init__(self, clock: Clock = None):
         self._clock = clock or get_rtc()
 
@@ -36,10 +75,62 @@ class TimeDependentSignalGenerator(SignalGenerator, ABC):
     def get_clock(self) -> Clock:
         return self._clock
 
+    def sample_array(self, dt: float, n: int) -> np.ndarray:
+        """
+        Returns ``n`` samples spaced ``dt`` seconds apart, starting at the
+        current time. The clock is not advanced.
+        """
+
+        t = self._t + dt * np.arange(n, dtype=float)
+        return self._sample_at(t)
+
+    def sample_batches(
+            self,
+            dt: float,
+            total: int,
+            chunk: int = 1024
+    ) -> Iterator[np.ndarray]:
+        """
+        Yields ``total`` samples spaced ``dt`` seconds apart, starting at the
+        current time, in arrays of up to ``chunk`` samples each. The clock is
+        not advanced.
+        """
+
+        self._check_chunk(chunk)
+
+        t0 = self._t
+        for start in range(0, total, chunk):
+            stop = min(start + chunk, total)
+            t = t0 + dt * np.arange(start, stop, dtype=float)
+            yield self._sample_at(t)
+
+    def _sample_at(self, t: np.ndarray) -> np.ndarray:
+        """
+        Returns the samples at the given array of times.
+
+        Subclasses should override this with a vectorized implementation. By
+        default, this calls ``sample`` once per time, with the clock
+        temporarily swapped for a ``SimClock`` set to that time. Any other
+        thread calling ``sample`` meanwhile will see that fake time.
+        """
+
+        clock = self._clock
+        samples = np.empty_like(t)
+        try:
+            for i, t_i in enumerate(t):
+                self._clock = SimClock(float(t_i))
+                samples[i] = self.sample()
+        finally:
+            self._clock = clock
+
+        return samples
+
 
 class PeriodicSignalGenerator(TimeDependentSignalGenerator, ABC):
     """A signal that repeats periodically."""
 
+    __slots__ = ('_freq',)
+
     def __init__(
             self,
             freq: float = None,
@@ -77,6 +168,11 @@ class PeriodicSignalGenerator(TimeDependentSignalGenerator, ABC):
         self._freq = freq
 
     def get_period(self) -> float:
+        """
+        Returns the period, i.e. ``1 / freq``. Sampling does not use this; it
+        works from the frequency directly.
+        """
+
         return 1.0 / self.get_freq()
 
     def set_period(self, period: float) -> None:
@@ -88,18 +184,28 @@ class PeriodicSignalGenerator(TimeDependentSignalGenerator, ABC):
             raise ValueError(f'freq must be >= 0; got {freq}.')
 
     def _get_period_fraction(self) -> float:
-        period = self.get_period()
-        t_in_period = self._t % period
-        fraction = t_in_period / period
-        return fraction
+        """Returns the elapsed fraction of the current period, in [0, 1)."""
+        return (self._t * self._freq) % 1.0
+
+    def _get_period_fractions(self, t: np.ndarray) -> np.ndarray:
+        return (t * self._freq) % 1.0
 
 
 class SineWaveGenerator(PeriodicSignalGenerator):
+    __slots__ = ()
+
     def sample(self) -> float:
-        return math.sin(2 * pi * self._freq * self._t)
+        # Wrap the phase into [0, 2*pi) so sin() gets a small argument. This
+        # does not recover precision already lost by rounding t * freq.
+        return math.sin(_TWO_PI * ((self._t * self._freq) % 1.0))
+
+    def _sample_at(self, t: np.ndarray) -> np.ndarray:
+        return np.sin(_TWO_PI * self._get_period_fractions(t))
 
 
 class PeriodicSignalGeneratorWithDutyCycle(PeriodicSignalGenerator, ABC):
+    __slots__ = ('_duty_cycle', '_inv_duty_cycle', '_inv_off_cycle')
+
     def __init__(
             self,
             freq: float = None,
@@ -124,20 +230,24 @@ class PeriodicSignalGeneratorWithDutyCycle(PeriodicSignalGenerator, ABC):
         self._validate_duty_cycle(duty_cycle)
         self._duty_cycle = duty_cycle
 
+        # Cache the inverses so sampling multiplies instead of divides. An
+        # empty on or off cycle gets an inverse of 0, which makes its term
+        # drop out of the triangle wave's max().
+        off_cycle = 1.0 - duty_cycle
+        self._inv_duty_cycle = 1.0 / duty_cycle if duty_cycle else 0.0
+        self._inv_off_cycle = 1.0 / off_cycle if off_cycle else 0.0
+
     def _validate_duty_cycle(self, duty_cycle: float) -> None:
         if duty_cycle < 0.0 or duty_cycle > 1.0:
             raise ValueError(
                 f'duty_cycle must be in range [0.0, 1.0]; got {duty_cycle}.')
 
-    def _is_in_duty_cycle(self) -> bool:
-        period_fraction = self._get_period_fraction()
-        duty_cycle = self.get_duty_cycle()
-        return period_fraction < duty_cycle
-
 
 class SquareWaveGenerator(PeriodicSignalGeneratorWithDutyCycle):
     """Alternates between outputting a 1.0 and a 0.0."""
 
+    __slots__ = ('min_value', 'max_value')
+
     def __init__(
             self,
             freq: float = None,
@@ -153,28 +263,33 @@ class SquareWaveGenerator(PeriodicSignalGeneratorWithDutyCycle):
         self.max_value = max_value
 
     def sample(self) -> float:
-        return self.max_value if self._is_in_duty_cycle() else self.min_value
+        in_duty_cycle = self._get_period_fraction() < self._duty_cycle
+        return (self.min_value, self.max_value)[in_duty_cycle]
+
+    def _sample_at(self, t: np.ndarray) -> np.ndarray:
+        in_duty_cycle = self._get_period_fractions(t) < self._duty_cycle
+        return np.where(in_duty_cycle, self.max_value, self.min_value)
 
 
 class TriangleWaveGenerator(PeriodicSignalGeneratorWithDutyCycle):
-    def sample(self) -> float:
-        if self._is_in_duty_cycle():
-            return self._get_upswing()
-        else:
-            return self._get_downswing()
+    __slots__ = ()
 
-    def _get_upswing(self) -> float:
-        period_fraction = self._get_period_fraction()
-        duty_cycle_fraction = period_fraction / self.get_duty_cycle()
-        return duty_cycle_fraction
+    def sample(self) -> float:
+        # Distance from the peak at the end of the duty cycle, scaled so it
+        # is 1 at both ends of the period. Only one of the two terms is
+        # positive at a time.
+        x = self._get_period_fraction() - self._duty_cycle
+        return 1.0 - max(-x * self._inv_duty_cycle, x * self._inv_off_cycle)
 
-    def _get_downswing(self) -> float:
-        remaining_period_fraction = 1.0 - self._get_period_fraction()
-        off_cycle = 1.0 - self.get_duty_cycle()
-        return remaining_period_fraction / off_cycle
+    def _sample_at(self, t: np.ndarray) -> np.ndarray:
+        x = self._get_period_fractions(t) - self._duty_cycle
+        return 1.0 - np.maximum(
+            -x * self._inv_duty_cycle, x * self._inv_off_cycle)
 
 
 class WaveTableSignalGenerator(PeriodicSignalGenerator):
+    __slots__ = ('_values',)
+
     def __init__(
             self,
             values: List[float],
@@ -206,8 +321,14 @@ class WaveTableSignalGenerator(PeriodicSignalGenerator):
         i = len(self._values) * self._get_period_fraction()
         return int(i)
 
+    def _sample_at(self, t: np.ndarray) -> np.ndarray:
+        i = len(self._values) * self._get_period_fractions(t)
+        return np.asarray(self._values, dtype=float)[i.astype(int)]
+
 
 class RandomSignalGenerator(SignalGenerator, ABC):
+    __slots__ = ('_rng', '_np_rng')
+
     def __init__(
             self,
             seed: int = None,
@@ -224,6 +345,8 @@ class RandomSignalGenerator(SignalGenerator, ABC):
         if seed is not None:
             self._rng.seed(seed)
 
+        self._set_np_rng(randomness, seed)
+
     def _set_rng(self, randomness: str) -> None:
         if randomness == 'pseudo':
             self._rng = random.Random()
@@ -235,10 +358,43 @@ class RandomSignalGenerator(SignalGenerator, ABC):
                 f'got {randomness!r}.'
             )
 
+    def _set_np_rng(self, randomness: str, seed) -> None:
+        if randomness != 'pseudo':
+            self._np_rng = None
+            return
+
+        # NumPy only accepts non-negative int seeds, while random.Random
+        # accepts any hashable, so derive the NumPy seed from a separate
+        # random.Random. Drawing from self._rng would change its samples.
+        if seed is not None:
+            seed = random.Random(seed).getrandbits(64)
+
+        self._np_rng = np.random.default_rng(seed)
+
+    def sample_array(self, dt: float, n: int) -> np.ndarray:
+        """
+        Returns ``n`` samples as an array. ``dt`` is unused, since random
+        signals do not depend on time.
+
+        With 'pseudo' randomness, the samples are drawn from a separate NumPy
+        RNG, so they will not match the samples returned by ``sample``, even
+        with the same seed.
+        """
+
+        if self._np_rng is None:
+            return super().sample_array(dt, n)
+
+        return self._sample_array(n)
+
+    def _sample_array(self, n: int) -> np.ndarray:
+        raise NotImplementedError()
+
 
 class UniformRandomSignalGenerator(RandomSignalGenerator):
     """Generates a random signal uniformly over the range [low, high)."""
 
+    __slots__ = ('low', 'high')
+
     def __init__(
             self,
             low: float = 0.0,
@@ -254,10 +410,15 @@ class UniformRandomSignalGenerator(RandomSignalGenerator):
     def sample(self) -> float:
         return self._rng.uniform(self.low, self.high)
 
+    def _sample_array(self, n: int) -> np.ndarray:
+        return self._np_rng.uniform(self.low, self.high, n)
+
 
 class GaussianRandomSignalGenerator(RandomSignalGenerator):
     """Generates a random signal sampled from a Gaussian distribution."""
 
+    __slots__ = ('mean', 'std_dev')
+
     def __init__(
             self,
             mean: float = 0.0,
@@ -272,3 +433,6 @@ class GaussianRandomSignalGenerator(RandomSignalGenerator):
 
     def sample(self) -> float:
         return self._rng.gauss(self.mean, self.std_dev)
+
+    def _sample_array(self, n: int) -> np.ndarray:
+        return self.mean + self.std_dev * self._np_rng.standard_normal(n)
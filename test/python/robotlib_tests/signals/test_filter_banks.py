@@ -0,0 +1,134 @@
+from unittest import TestCase
+
+import numpy as np
+
+from robotlib.signals.filter_banks import (
+    LowPassFilterBank,
+    HighPassFilterBank,
+    BandPassFilterBank
+)
+from robotlib.signals.filters import (
+    LowPassFilter,
+    HighPassFilter,
+    BandPassFilter
+)
+
+
+def _make_values(channel_count: int, sample_count: int) -> np.ndarray:
+    t = np.linspace(0, 20, sample_count)
+    return np.array([
+        np.sin((channel + 1) * t) + 0.1 * channel
+        for channel in range(channel_count)
+    ]).T
+
+
+class TestLowPassFilterBank(TestCase):
+    def test_init__not_1d__raises_ValueError(self):
+        with self.assertRaises(ValueError):
+            LowPassFilterBank([[1, 2], [3, 4]])
+
+    def test_init__wrong_init_values_shape__raises_ValueError(self):
+        with self.assertRaises(ValueError):
+            LowPassFilterBank([1, 2, 3], init_values=[0, 1])
+
+    def test_set_cutoff_freqs__less_than_0__raises_ValueError(self):
+        bank = LowPassFilterBank([1, 2, 3])
+
+        with self.assertRaises(ValueError):
+            bank.set_cutoff_freqs([1, -0.01, 3])
+
+    def test_set_cutoff_freqs_and_get_cutoff_freqs(self):
+        bank = LowPassFilterBank([1, 2, 3])
+
+        bank.set_cutoff_freqs([4, 5, 6])
+
+        np.testing.assert_array_equal([4, 5, 6], bank.get_cutoff_freqs())
+
+    def test_get_channel_count(self):
+        bank = LowPassFilterBank([1, 2, 3])
+
+        self.assertEqual(3, bank.get_channel_count())
+
+    def test_filter__matches_separate_filters(self):
+        cutoff_freqs = [0.5, 3, 30]
+        init_values = [0.0, 0.2, -1.0]
+        bank = LowPassFilterBank(cutoff_freqs, init_values=init_values)
+        filters = [
+            LowPassFilter(cutoff_freq, init_value=init_value)
+            for cutoff_freq, init_value in zip(cutoff_freqs, init_values)
+        ]
+        dt = 1 / 100
+
+        for values in _make_values(3, 100):
+            expected = [f(value, dt) for f, value in zip(filters, values)]
+            np.testing.assert_allclose(expected, bank(values, dt))
+
+
+class TestHighPassFilterBank(TestCase):
+    def test_filter__matches_separate_filters(self):
+        cutoff_freqs = [0.5, 3, 30]
+        init_values = [0.0, 0.2, -1.0]
+        bank = HighPassFilterBank(cutoff_freqs, init_values=init_values)
+        filters = [
+            HighPassFilter(cutoff_freq, init_value=init_value)
+            for cutoff_freq, init_value in zip(cutoff_freqs, init_values)
+        ]
+        dt = 1 / 100
+
+        for values in _make_values(3, 100):
+            expected = [f(value, dt) for f, value in zip(filters, values)]
+            np.testing.assert_allclose(expected, bank(values, dt))
+
+    def test_filter__set_cutoff_freqs_between_calls(self):
+        bank = HighPassFilterBank([1, 1])
+        f = HighPassFilter(1)
+        dt = 1 / 100
+
+        bank.filter(np.array([1.0, 1.0]), dt)
+        f.filter(1.0, dt)
+
+        bank.set_cutoff_freqs(3)
+        f.set_cutoff_freq(3)
+
+        np.testing.assert_allclose(
+            [f.filter(0.5, dt)] * 2, bank.filter(np.array([0.5, 0.5]), dt))
+
+
+class TestBandPassFilterBank(TestCase):
+    def test_init__low_higher_than_high__raises_ValueError(self):
+        with self.assertRaises(ValueError):
+            BandPassFilterBank([1, 10], [10, 1])
+
+    def test_filter__matches_separate_filters(self):
+        low_cutoff_freqs = [0.5, 1, 2]
+        high_cutoff_freqs = [3, 10, 30]
+        init_values = [0.0, 0.2, -1.0]
+        bank = BandPassFilterBank(
+            low_cutoff_freqs,
+            high_cutoff_freqs,
+            init_values=init_values
+        )
+        filters = [
+            BandPassFilter(low, high, init_value=init_value)
+            for low, high, init_value in zip(
+                low_cutoff_freqs, high_cutoff_freqs, init_values)
+        ]
+        dt = 1 / 100
+
+        for values in _make_values(3, 100):
+            expected = [f(value, dt) for f, value in zip(filters, values)]
+            np.testing.assert_allclose(expected, bank(values, dt))
+
+    def test_filter__set_cutoff_freqs_between_calls(self):
+        bank = BandPassFilterBank([1, 1], [10, 10])
+        f = BandPassFilter(1, 10)
+        dt = 1 / 100
+
+        bank.filter(np.array([1.0, 1.0]), dt)
+        f.filter(1.0, dt)
+
+        bank.set_cutoff_freqs(2, 20)
+        f.set_cutoff_freqs(2, 20)
+
+        np.testing.assert_allclose(
+            [f.filter(0.5, dt)] * 2, bank.filter(np.array([0.5, 0.5]), dt))
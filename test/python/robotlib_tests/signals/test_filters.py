@@ -1,7 +1,16 @@
-from unittest import TestCase
+from unittest import TestCase, skipUnless
+from unittest.mock import patch
 from math import pi
 
-from robotlib.signals.filters import LowPassFilter, HighPassFilter
+import numpy as np
+
+from robotlib.signals import filters
+from robotlib.signals.filters import (
+    LowPassFilter,
+    HighPassFilter,
+    BandPassFilter,
+    BandStopFilter
+)
 
 
 class TestLowPassFilter(TestCase):
@@ -43,6 +52,19 @@ class TestLowPassFilter(TestCase):
         output = f.filter(1, dt)
         self.assertAlmostEqual(0.875, output)
 
+    def test_filter__set_cutoff_freq_between_calls(self):
+        f = LowPassFilter(1)
+        dt = 1 / (2 * pi)
+
+        output = f.filter(1, dt)
+        self.assertAlmostEqual(0.5, output)
+
+        # This will make alpha = 0.75
+        f.set_cutoff_freq(3)
+
+        output = f.filter(1, dt)
+        self.assertAlmostEqual(0.875, output)
+
     def test_filter__complex(self):
         f = LowPassFilter(120)
         dt = 1 / 44100
@@ -53,6 +75,79 @@ class TestLowPassFilter(TestCase):
         output = f.filter(0.34, dt)
         self.assertAlmostEqual(0.0095165, output)
 
+    def test_filter__array_dt(self):
+        f = LowPassFilter(1)
+
+        output = f.filter(np.array([1.0, 2.0]), np.array([0.01, 0.02]))
+        np.testing.assert_allclose([0.0591174, 0.2232704], output, rtol=1e-6)
+
+        output = f.filter(1.0, 0.01)
+        np.testing.assert_allclose([0.1147399, 0.2691887], output, rtol=1e-6)
+
+    def test_call__subclass_overrides_filter(self):
+        class DoublingLowPassFilter(LowPassFilter):
+            def filter(self, value: float, dt: float) -> float:
+                return 2 * super().filter(value, dt)
+
+        f = DoublingLowPassFilter(1)
+        expected = 2 * LowPassFilter(1).filter(1.0, 0.01)
+
+        self.assertAlmostEqual(expected, f(1.0, 0.01))
+
+    def test_filter_array__const_dt__matches_filter(self):
+        values = np.sin(np.linspace(0, 20, 100)) + 0.5
+        dt = 1 / 100
+        expected_filter = LowPassFilter(3, init_value=0.2)
+        f = LowPassFilter(3, init_value=0.2)
+
+        expected = [expected_filter.filter(v, dt) for v in values]
+        output = f.filter_array(values, dt)
+
+        np.testing.assert_allclose(expected, output)
+        self.assertAlmostEqual(
+            expected_filter.filter(1.0, dt), f.filter(1.0, dt))
+
+    def test_filter_array__const_dt_without_scipy__matches_filter(self):
+        values = np.sin(np.linspace(0, 20, 100)) + 0.5
+        dt = 1 / 100
+        expected_filter = LowPassFilter(3, init_value=0.2)
+        f = LowPassFilter(3, init_value=0.2)
+
+        expected = [expected_filter.filter(v, dt) for v in values]
+        with patch.object(filters, 'lfilter', None):
+            output = f.filter_array(values, dt)
+
+        np.testing.assert_allclose(expected, output)
+
+    def test_filter_array__state_stays_float(self):
+        f = LowPassFilter(3)
+
+        f.filter_array(np.array([1.0, 2.0]), np.array([0.01, 0.01]))
+
+        self.assertIs(float, type(f.filter(1.0, 0.01)))
+
+    def test_filter_array__var_dt__matches_filter(self):
+        values = np.sin(np.linspace(0, 20, 100)) + 0.5
+        dts = np.linspace(0.001, 0.02, 100)
+        expected_filter = LowPassFilter(3, init_value=0.2)
+        f = LowPassFilter(3, init_value=0.2)
+
+        expected = [
+            expected_filter.filter(v, dt) for v, dt in zip(values, dts)
+        ]
+        output = f.filter_array(values, dts)
+
+        np.testing.assert_allclose(expected, output)
+        self.assertAlmostEqual(
+            expected_filter.filter(1.0, 0.01), f.filter(1.0, 0.01))
+
+    def test_filter_array__empty(self):
+        f = LowPassFilter(3)
+
+        output = f.filter_array(np.array([]), 0.01)
+
+        self.assertEqual(0, output.size)
+
 
 class TestHighPassFilter(TestCase):
     def test_set_cutoff_freq__0__good(self):
@@ -93,6 +188,19 @@ class TestHighPassFilter(TestCase):
         output = f.filter(1, dt)
         self.assertAlmostEqual(0.125, output)
 
+    def test_filter__set_cutoff_freq_between_calls(self):
+        f = HighPassFilter(1)
+        dt = 1 / (2 * pi)
+
+        output = f.filter(1, dt)
+        self.assertAlmostEqual(0.5, output)
+
+        # This will make alpha = 0.25
+        f.set_cutoff_freq(3)
+
+        output = f.filter(1, dt)
+        self.assertAlmostEqual(0.125, output)
+
     def test_filter__complex(self):
         f = HighPassFilter(120)
         dt = 1 / 44100
@@ -102,3 +210,137 @@ class TestHighPassFilter(TestCase):
 
         output = f.filter(0.34, dt)
         self.assertAlmostEqual(0.3304835, output)
+
+    def test_filter__array_dt(self):
+        f = HighPassFilter(1)
+
+        output = f.filter(np.array([1.0, 2.0]), np.array([0.01, 0.02]))
+
+        np.testing.assert_allclose([0.9408826, 1.7767296], output, rtol=1e-6)
+
+    def test_filter_array__const_dt__matches_filter(self):
+        values = np.sin(np.linspace(0, 20, 100)) + 0.5
+        dt = 1 / 100
+        expected_filter = HighPassFilter(3, init_value=0.2)
+        f = HighPassFilter(3, init_value=0.2)
+
+        expected = [expected_filter.filter(v, dt) for v in values]
+        output = f.filter_array(values, dt)
+
+        np.testing.assert_allclose(expected, output)
+        self.assertAlmostEqual(
+            expected_filter.filter(1.0, dt), f.filter(1.0, dt))
+
+    def test_filter_array__const_dt_without_scipy__matches_filter(self):
+        values = np.sin(np.linspace(0, 20, 100)) + 0.5
+        dt = 1 / 100
+        expected_filter = HighPassFilter(3, init_value=0.2)
+        f = HighPassFilter(3, init_value=0.2)
+
+        expected = [expected_filter.filter(v, dt) for v in values]
+        with patch.object(filters, 'lfilter', None):
+            output = f.filter_array(values, dt)
+
+        np.testing.assert_allclose(expected, output)
+
+    def test_filter_array__state_stays_float(self):
+        f = HighPassFilter(3)
+
+        f.filter_array(np.array([1.0, 2.0]), np.array([0.01, 0.01]))
+
+        self.assertIs(float, type(f.filter(1.0, 0.01)))
+
+    def test_filter_array__var_dt__matches_filter(self):
+        values = np.sin(np.linspace(0, 20, 100)) + 0.5
+        dts = np.linspace(0.001, 0.02, 100)
+        expected_filter = HighPassFilter(3, init_value=0.2)
+        f = HighPassFilter(3, init_value=0.2)
+
+        expected = [
+            expected_filter.filter(v, dt) for v, dt in zip(values, dts)
+        ]
+        output = f.filter_array(values, dts)
+
+        np.testing.assert_allclose(expected, output)
+        self.assertAlmostEqual(
+            expected_filter.filter(1.0, 0.01), f.filter(1.0, 0.01))
+
+    def test_filter_array__empty(self):
+        f = HighPassFilter(3)
+
+        output = f.filter_array(np.array([]), 0.01)
+
+        self.assertEqual(0, output.size)
+
+
+class TestBandPassFilter(TestCase):
+    def test_init__low_higher_than_high__raises_ValueError(self):
+        with self.assertRaises(ValueError):
+            BandPassFilter(10, 1)
+
+    def test_init__low_less_than_0__raises_ValueError(self):
+        with self.assertRaises(ValueError):
+            BandPassFilter(-0.01, 1)
+
+    def test_set_cutoff_freqs_and_get_cutoff_freqs(self):
+        f = BandPassFilter(1, 10)
+
+        f.set_cutoff_freqs(2, 20)
+
+        self.assertEqual((2, 20), f.get_cutoff_freqs())
+
+    def test_filter__matches_hpf_then_lpf(self):
+        f = BandPassFilter(2, 30, init_value=0.3)
+        hpf = HighPassFilter(2, init_value=0.3)
+        lpf = LowPassFilter(30, init_value=0.3)
+        dt = 1 / 100
+
+        for value in np.sin(np.linspace(0, 20, 100)):
+            expected = lpf.filter(hpf.filter(value, dt), dt)
+            self.assertAlmostEqual(expected, f.filter(value, dt))
+
+
+class TestBandStopFilter(TestCase):
+    def test_init__low_higher_than_high__raises_ValueError(self):
+        with self.assertRaises(ValueError):
+            BandStopFilter(10, 1)
+
+    def test_set_cutoff_freqs_and_get_cutoff_freqs(self):
+        f = BandStopFilter(1, 10)
+
+        f.set_cutoff_freqs(2, 20)
+
+        self.assertEqual((2, 20), f.get_cutoff_freqs())
+
+    def test_filter__matches_lpf_plus_hpf(self):
+        f = BandStopFilter(2, 30, init_value=0.3)
+        lpf = LowPassFilter(2, init_value=0.3)
+        hpf = HighPassFilter(30, init_value=0.3)
+        dt = 1 / 100
+
+        for value in np.sin(np.linspace(0, 20, 100)):
+            expected = lpf.filter(value, dt) + hpf.filter(value, dt)
+            self.assertAlmostEqual(expected, f.filter(value, dt))
+
+
+@skipUnless(filters._filters_c, 'compiled _filters_c extension is not built')
+class TestCompiledFilters(TestCase):
+    def _assert_matches_pure_python(self, make_filter) -> None:
+        compiled_filter = make_filter()
+        python_filter = make_filter()
+        dt = 1 / 100
+
+        for value in np.sin(np.linspace(0, 20, 100)):
+            with patch.object(filters, '_filters_c', None):
+                expected = python_filter.filter(value, dt)
+
+            output = compiled_filter.filter(value, dt)
+            self.assertAlmostEqual(expected, output)
+
+    def test_band_pass_filter__matches_pure_python(self):
+        self._assert_matches_pure_python(
+            lambda: BandPassFilter(2, 30, init_value=0.3))
+
+    def test_band_stop_filter__matches_pure_python(self):
+        self._assert_matches_pure_python(
+            lambda: BandStopFilter(2, 30, init_value=0.3))
@@ -1,9 +1,13 @@
 import unittest
-from typing import Iterator
+from typing import Callable, Iterator
+
+import numpy as np
+from parameterized import parameterized
 
 from robotlib.clocks import SimClock
 from robotlib.signals.generators import (
     SignalGenerator,
+    TimeDependentSignalGenerator,
     SineWaveGenerator,
     PeriodicSignalGenerator,
     SquareWaveGenerator,
@@ -82,6 +86,70 @@ class TestSignalGenerator(TestCase):
         self.assertEqual(4, next(gen))
         self.assertEqual(7, next(gen))
 
+    def test_sample_array(self):
+        gen = SignalGeneratorImpl([2, 4, 7])
+
+        result = gen.sample_array(0.1, 5)
+
+        self.assertIsInstance(result, np.ndarray)
+        self.assertListEqual([2, 4, 7, 2, 4], list(result))
+
+    def test_sample_batches(self):
+        gen = SignalGeneratorImpl([2, 4, 7])
+
+        result = list(gen.sample_batches(0.1, 8, chunk=3))
+
+        self.assertListEqual([3, 3, 2], [len(batch) for batch in result])
+        self.assertListEqual(
+            [2, 4, 7, 2, 4, 7, 2, 4], list(np.concatenate(result)))
+
+    def test_sample_batches__total_0__yields_nothing(self):
+        gen = SignalGeneratorImpl([2, 4, 7])
+
+        result = list(gen.sample_batches(0.1, 0))
+
+        self.assertListEqual([], result)
+
+    def test_sample_batches__chunk_0__raises_ValueError(self):
+        gen = SignalGeneratorImpl([2, 4, 7])
+
+        with self.assertRaises(ValueError):
+            list(gen.sample_batches(0.1, 8, chunk=0))
+
+
+class RampSignalGeneratorImpl(TimeDependentSignalGenerator):
+    def sample(self) -> float:
+        return self._t
+
+
+class TestTimeDependentSignalGenerator(TestCase):
+    def setUp(self) -> None:
+        self.clock = SimClock(1.0)
+
+    def test_sample_array__only_sample_defined__loops_over_sample(self):
+        gen = RampSignalGeneratorImpl(self.clock)
+
+        result = gen.sample_array(0.1, 3)
+
+        self.assert_list_almost_equal([1.0, 1.1, 1.2], list(result))
+        self.assertIs(self.clock, gen.get_clock())
+        self.assertEqual(1.0, self.clock.get_time())
+
+    def test_sample_batches__only_sample_defined__loops_over_sample(self):
+        gen = RampSignalGeneratorImpl(self.clock)
+
+        result = list(gen.sample_batches(0.1, 5, chunk=2))
+
+        self.assertListEqual([2, 2, 1], [len(batch) for batch in result])
+        self.assert_list_almost_equal(
+            [1.0, 1.1, 1.2, 1.3, 1.4], list(np.concatenate(result)))
+
+    def test_sample_batches__chunk_less_than_0__raises_ValueError(self):
+        gen = RampSignalGeneratorImpl(self.clock)
+
+        with self.assertRaises(ValueError):
+            list(gen.sample_batches(0.1, 5, chunk=-1))
+
 
 class PeriodicSignalGeneratorImpl(PeriodicSignalGenerator):
     def sample(self) -> float:
@@ -133,6 +201,37 @@ class TestPeriodicSignalGenerator(TestCase):
 
         self.assertAlmostEqual(0.123, result)
 
+    @parameterized.expand([
+        [lambda clock: SineWaveGenerator(3, clock=clock)],
+        [lambda clock: SquareWaveGenerator(
+            freq=3,
+            duty_cycle=0.3,
+            min_value=-0.2,
+            max_value=1.5,
+            clock=clock
+        )],
+        [lambda clock: TriangleWaveGenerator(3, duty_cycle=0.3, clock=clock)],
+        [lambda clock: WaveTableSignalGenerator(
+            [1, 2, 4, 8, 16], freq=3, clock=clock)],
+    ])
+    def test_sample_array__matches_sample(
+            self,
+            make_gen: Callable[[SimClock], PeriodicSignalGenerator]
+    ) -> None:
+        clock = SimClock(3.21)
+        gen = make_gen(clock)
+        dt = 0.0123
+
+        result = gen.sample_array(dt, 50)
+
+        expected = []
+        for i in range(50):
+            clock.set_time(3.21 + dt * i)
+            expected.append(gen.sample())
+
+        self.assertEqual((50,), result.shape)
+        self.assert_list_almost_equal(expected, list(result))
+
 
 class TestSineWaveGenerator(TestCase):
     def setUp(self) -> None:
@@ -161,6 +260,29 @@ class TestSineWaveGenerator(TestCase):
         result = gen.sample()
         self.assertAlmostEqual(0.0, result)
 
+    def test_sample_batches__matches_sample_array(self):
+        gen = SineWaveGenerator(3, clock=self.clock)
+        self.clock.set_time(3.21)
+        dt = 0.0123
+
+        batches = list(gen.sample_batches(dt, 50, chunk=16))
+
+        self.assertListEqual([16, 16, 16, 2], [len(b) for b in batches])
+        self.assert_list_almost_equal(
+            list(gen.sample_array(dt, 50)),
+            list(np.concatenate(batches))
+        )
+
+    def test_sample__large_time(self):
+        gen = SineWaveGenerator(7, clock=self.clock)
+
+        # t * freq = 864197523.875 exactly, so the phase is 7/8 of a cycle.
+        # Computing sin(2 * pi * freq * t) directly is off by about 1.7e-7.
+        self.clock.set_time(123456789.125)
+        result = gen.sample()
+
+        self.assertAlmostEqual(-0.7071067812, result, places=9)
+
 
 class TestSquareWaveGenerator(TestCase):
     def setUp(self) -> None:
@@ -380,6 +502,15 @@ class TestTriangleWaveGenerator(TestCase):
         result = gen.sample()
         self.assertAlmostEqual(0.0, result)
 
+    def test_sample_array__duty_cycle_0_and_1(self):
+        for duty_cycle in (0.0, 1.0):
+            gen = TriangleWaveGenerator(
+                1, duty_cycle=duty_cycle, clock=self.clock)
+
+            result = gen.sample_array(0.1, 10)
+
+            self.assertTrue(np.all(np.isfinite(result)))
+
 
 class TestWaveTableSignalGenerator(TestCase):
     def setUp(self) -> None:
@@ -472,6 +603,43 @@ class TestUniformRandomSignalGenerator(TestCase):
 
         self.assert_list_almost_equal(expected, results)
 
+    def test_sample_array__within_range(self):
+        low, high = -2, 4
+
+        for randomness in ('pseudo', 'true'):
+            gen = UniformRandomSignalGenerator(
+                low=low, high=high, randomness=randomness)
+
+            results = gen.sample_array(0.1, 100)
+
+            self.assertEqual((100,), results.shape)
+            self.assertTrue(np.all(results >= low))
+            self.assertTrue(np.all(results < high))
+
+    def test_sample_array__with_seed__repeatable(self):
+        gen1 = UniformRandomSignalGenerator(low=-2, high=4, seed=1)
+        gen2 = UniformRandomSignalGenerator(low=-2, high=4, seed=1)
+
+        results1 = gen1.sample_array(0.1, 10)
+        results2 = gen2.sample_array(0.1, 10)
+
+        self.assert_list_almost_equal(list(results1), list(results2))
+
+    def test_sample_array__negative_seed__repeatable(self):
+        gen1 = UniformRandomSignalGenerator(seed=-1)
+        gen2 = UniformRandomSignalGenerator(seed=-1)
+
+        results1 = gen1.sample_array(0.1, 10)
+        results2 = gen2.sample_array(0.1, 10)
+
+        self.assert_list_almost_equal(list(results1), list(results2))
+
+    def test_init__non_int_seed(self):
+        for seed in ('abc', 1.5):
+            gen = UniformRandomSignalGenerator(seed=seed)
+
+            self.assertEqual((3,), gen.sample_array(0.1, 3).shape)
+
 
 class TestGaussianRandomSignalGenerator(TestCase):
     def test_samples__with_seed(self):
@@ -495,6 +663,15 @@ class TestGaussianRandomSignalGenerator(TestCase):
 
         self.assert_list_almost_equal(expected, results)
 
+    def test_sample_array__statistics(self):
+        gen = GaussianRandomSignalGenerator(mean=10, std_dev=2, seed=2)
+
+        results = gen.sample_array(0.1, 10000)
+
+        self.assertEqual((10000,), results.shape)
+        self.assertAlmostEqual(10, np.mean(results), delta=0.1)
+        self.assertAlmostEqual(2, np.std(results), delta=0.1)
+
 
 if __name__ == '__main__':
     unittest.main()